@@ -1,18 +1,18 @@
 import itertools as it
+import os
 import warnings
 
 warnings.filterwarnings('ignore', category=RuntimeWarning)
 
 import dask
-import dask.dataframe as dd
 import numpy as np
 import pandas as pd
 
-from q2_types.feature_data import (DNAFASTAFormat, DNAIterator)
+from q2_types.feature_data import DNAFASTAFormat
 from q2_sidle._formats import KmerAlignFormat
-from q2_feature_classifier._skl import _chunks
 
 from q2_sidle._utils import (_setup_dask_client, 
+                             _read_fasta_blocks,
                              degen_sub2
                              )
 
@@ -66,37 +66,31 @@ def align_regional_kmers(kmers: DNAFASTAFormat,
     _setup_dask_client(debug=debug, cluster_config=None,  
                        n_workers=n_workers, address=client_address)
 
-    # Converts the representative sequences to a delayed object
+    # Encodes the representative sequences once so that each task receives
+    # a compact block of bytes rather than a partition of python strings
     num_asvs, asv_length = _check_read_lengths(rep_seq, 'rep_seq')
-    rep_seq_ids  = rep_seq.index.values
-    rep_seq = dd.from_pandas(rep_seq.astype(str),
-                             chunksize=chunk_size)
+    asv_blocks = _split_encoded(*_encode_seqs(rep_seq), chunk_size)
 
     ff = KmerAlignFormat()
 
     # Performs the alignment
-    for i,  batch in enumerate(_chunks(kmers.view(DNAIterator), 
-                               chunk_size * 100)):
-       
-
+    for i,  batch in enumerate(_read_fasta_blocks(str(kmers), 
+                                                  chunk_size * 100)):
         if i == 0:
-            batch = pd.Series({s.metadata['id']: str(s) for s in batch})
             num_kmers, kmer_length = _check_read_lengths(batch, 'kmer')
 
             if kmer_length != asv_length:
                 raise ValueError('The kmer and ASV sequences must be the'
                                  ' same length')
-            batch = dd.from_pandas(batch, chunksize=chunk_size)
-        else:
-            batch = dd.from_pandas(
-                pd.Series({s.metadata['id']: str(s) for s in batch}),
-                chunksize=chunk_size
-                )
+        kmer_blocks = _split_encoded(*_encode_seqs(batch), chunk_size)
 
-        aligned_batch = np.hstack([
-            dask.delayed(_align_kmers)(kmer, asv, max_mismatch)
-            for kmer, asv in it.product(batch.to_delayed(), rep_seq.to_delayed())
-            ])
+        aligned_batch = [
+            dask.delayed(_align_encoded)(kmer_ids, kmer_codes, 
+                                         asv_ids, asv_codes, 
+                                         max_mismatch)
+            for (kmer_ids, kmer_codes), (asv_ids, asv_codes) 
+            in it.product(kmer_blocks, asv_blocks)
+            ]
 
         aligned_batch = pd.concat(axis=0, objs=dask.compute(*aligned_batch))
 
@@ -114,7 +108,7 @@ def align_regional_kmers(kmers: DNAFASTAFormat,
 
 
 def _align_kmers(reads1, reads2, allowed_mismatch=2, read1_label='kmer', 
-    read2_label='asv', block_size=500):
+    read2_label='asv', block_size=None):
     """
     Performs a kmer-based alignment between two groups of n-mers
     Parameters
@@ -126,6 +120,9 @@ def _align_kmers(reads1, reads2, allowed_mismatch=2, read1_label='kmer',
         The number of mismatches allowed between the two sets of sequences.
     read1_label, read2_label: str, optional
         A way to refer to the sequences in each alignment set
+    block_size: int, optional
+        The number of reads from each set compared together in a single
+        tile. By default, this is chosen from the processor cache size.
     allow_degen1, allow_degen2 : bool, optional
         Whether degeneracy should be allowed in the alignment. If 
         `allow_degen1` and `allow_degen2`, then sequences
@@ -146,27 +143,191 @@ def _align_kmers(reads1, reads2, allowed_mismatch=2, read1_label='kmer',
         If the two sets fo reads are of different lengths. (We can't align 
         kmers here that are different lengths).
     """
-    reads1 = reads1.apply(lambda x: np.array(list(x)))
-    reads2 = reads2.apply(lambda x: np.array(list(x)))
-    length = len(reads1.iloc[0])
-    match = pd.Series({
-        (id1, id2) : np.sum(seq1 == seq2)
-        for (id1, seq1), (id2, seq2) 
-        in it.product(reads1.items(), reads2.items())
-        })
-    match = length - match
-    match = match.loc[match <= allowed_mismatch]
-    match.index.set_names([read1_label, read2_label], inplace=True)
-    match.name = 'mismatch'
-    match = match.reset_index()
-    match['length'] = length
+    ids1, codes1 = _encode_seqs(reads1)
+    ids2, codes2 = _encode_seqs(reads2)
+
+    return _align_encoded(ids1, codes1, ids2, codes2, 
+                          allowed_mismatch=allowed_mismatch,
+                          read1_label=read1_label,
+                          read2_label=read2_label,
+                          block_size=block_size)
+
+
+def _align_encoded(ids1, codes1, ids2, codes2, allowed_mismatch=2, 
+    read1_label='kmer', read2_label='asv', block_size=None):
+    """
+    Performs a kmer-based alignment between two groups of encoded n-mers
+
+    Parameters
+    ----------
+    ids1, ids2: ndarray
+        The sequence identifiers for each set of reads
+    codes1, codes2 : ndarray
+        The (number of reads x read length) uint8 arrays of encoded reads
+        (see `_encode_seqs`)
+    allowed_mismatch : int, optional
+        The number of mismatches allowed between the two sets of sequences.
+    read1_label, read2_label: str, optional
+        A way to refer to the sequences in each alignment set
+    block_size: int, optional
+        The number of reads from each set compared together in a single
+        tile. By default, this is chosen from the processor cache size.
+
+    Returns
+    -------
+    pd.DataFrame
+        A long-form dataframe giving the two read identifiers and the number
+        of nt that do not match.
+    """
+    length = codes1.shape[1]
+    if block_size is None:
+        block_size = _default_block_size(length)
+
+    # Walks the pairs in tiles so the comparison for each block stays small
+    # enough to remain in cache instead of materializing every pair at once
+    tiles = [
+        _align_block(codes1[i:(i + block_size)], 
+                     codes2[j:(j + block_size)], 
+                     allowed_mismatch, 
+                     offset1=i, 
+                     offset2=j)
+        for i in np.arange(0, len(codes1), block_size)
+        for j in np.arange(0, len(codes2), block_size)
+        ]
+    idx1, idx2, mismatch = [np.hstack(x) for x in zip(*tiles)]
+    order = np.lexsort([idx2, idx1])
+    idx1, idx2, mismatch = idx1[order], idx2[order], mismatch[order]
 
-    match[read1_label] = match[read1_label].astype(str)
-    match[read2_label] = match[read2_label].astype(str)
+    match = pd.DataFrame({
+        read1_label: ids1[idx1].astype(str),
+        read2_label: ids2[idx2].astype(str),
+        'length': length,
+        'mismatch': mismatch.astype(int),
+        })
 
     return match[[read1_label, read2_label, 'length', 'mismatch']]
 
 
+def _resolve_cache_size(default=262144):
+    """
+    Looks up the size of the per-core cache on the current machine
+
+    Parameters
+    ----------
+    default : int, optional
+        The size (in bytes) to use when the cache size can't be determined
+
+    Returns
+    -------
+    int
+        The size of the level 2 cache in bytes, or the default
+    """
+    try:
+        size = os.sysconf('SC_LEVEL2_CACHE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        size = 0
+    if size is None or size <= 0:
+        size = default
+    return int(size)
+
+
+# The cache size is looked up once at import and sets the default tile size
+# used when aligning blocks of reads
+_cache_size = _resolve_cache_size()
+
+
+def _default_block_size(length):
+    """
+    Picks a tile size so the pairwise comparison for a tile fits in cache
+
+    Parameters
+    ----------
+    length : int
+        The length of the reads being compared
+
+    Returns
+    -------
+    int
+        The number of reads from each set to compare in a single tile
+    """
+    pair_size = length + _count_dtype(length).itemsize
+    return max(16, int(np.sqrt(_cache_size / pair_size)))
+
+
+def _count_dtype(length):
+    """
+    Gets the narrowest integer type able to count mismatches in a read
+    """
+    return np.min_scalar_type(length)
+
+
+def _align_block(codes1, codes2, allowed_mismatch=2, offset1=0, offset2=0):
+    """
+    Finds the read pairs within a tile of encoded reads that align
+
+    Parameters
+    ----------
+    codes1, codes2: ndarray
+        The (number of reads x read length) uint8 arrays of encoded reads
+        to be compared
+    allowed_mismatch: int, optional
+        The number of mismatches allowed between the two sets of sequences.
+    offset1, offset2: int, optional
+        The position of the first read in each tile within the full set of
+        reads
+
+    Returns
+    -------
+    ndarray
+        The position of the first read in each aligned pair
+    ndarray
+        The position of the second read in each aligned pair
+    ndarray
+        The number of mismatched nucleotides between the pair
+    """
+    # Compares every pair of reads position by position in a single
+    # broadcast over the encoded arrays
+    mismatch = \
+        (codes1[:, np.newaxis, :] != codes2[np.newaxis, :, :]).sum(
+            axis=2, dtype=_count_dtype(codes1.shape[1]))
+    idx1, idx2 = np.nonzero(mismatch <= allowed_mismatch)
+
+    return idx1 + offset1, idx2 + offset2, mismatch[idx1, idx2]
+
+
+def _encode_seqs(reads):
+    """
+    Encodes a series of equal length sequences as a 2D array of bytes
+
+    Parameters
+    ----------
+    reads: Series
+        The sequences to be encoded, where the sequence identifier is given
+        in the index.
+
+    Returns
+    -------
+    ndarray
+        The sequence identifiers
+    ndarray
+        A (number of reads x read length) uint8 array where each entry is
+        the ASCII code for the nucleotide at that position
+    """
+    seqs = reads.astype(str).values
+    length = len(seqs[0]) if len(seqs) > 0 else 0
+    codes = np.frombuffer(''.join(seqs).encode('ascii'), dtype=np.uint8)
+
+    return reads.index.values, codes.reshape(len(seqs), length)
+
+
+def _split_encoded(ids, codes, chunk_size):
+    """
+    Splits a set of encoded reads into blocks of at most `chunk_size` reads
+    """
+    return [(ids[i:(i + chunk_size)], codes[i:(i + chunk_size)]) 
+            for i in np.arange(0, len(ids), chunk_size)]
+
+
 def _check_read_lengths(reads, read_label):
     """
     Checks the length of the sequences
@@ -7,20 +7,27 @@ import dask
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
-import skbio
 from skbio import DNA
 
 from qiime2 import Metadata
-from q2_types.feature_data import (DNAFASTAFormat, DNAIterator)
+from q2_types.feature_data import DNAFASTAFormat
 from q2_sidle._utils import (_setup_dask_client, 
+                             _read_fasta_blocks,
+                             degenerate_map,
                              )
-from q2_feature_classifier._skl import _chunks
 
 
 complement = {'A': 'T', 'T': 'A', 'G': 'C',  'C': 'G',
               'R': 'Y', 'Y': 'R', 'S': 'S',  'W': 'W',
               'K': 'M', 'M': 'K', 'B': 'V', 'V': 'B',
               'D': 'H', 'H': 'D', 'N': 'N'}
+complement_table = str.maketrans(complement)
+# The nucleotide codes each degenerate nucleotide code resolves to
+degen_codes = {ord(k): np.frombuffer(''.join(v).encode('ascii'), 
+                                     dtype=np.uint8)
+               for k, v in degenerate_map.items()}
+is_degen = np.zeros(256, dtype=bool)
+is_degen[list(degen_codes.keys())] = True
 
 
 def prepare_extracted_region(sequences: DNAFASTAFormat, 
@@ -78,10 +85,10 @@ def prepare_extracted_region(sequences: DNAFASTAFormat,
     if reverse_complement_rev:
         rev_primer = str(DNA(rev_primer).reverse_complement())
 
-    # Reads in the sequences
-    sequences = sequences.view(DNAIterator)
+    # Reads in the sequences as blocks of strings
     seq_blocks = [dask.delayed(_block_seqs)(seq)
-                  for seq in _chunks(sequences, int((chunk_size)))]
+                  for seq in _read_fasta_blocks(str(sequences), 
+                                                int(chunk_size))]
     # Makes the fake extraction position based on the trim length
     fragment = [dask.delayed(_artifical_trim)(seq, trim_length) 
                 for seq in seq_blocks]
@@ -122,8 +129,9 @@ def _block_seqs(seqs, degen_thresh=3):
     """
     Converts the sequences into an expanded sequence block
     """
-    s2 = pd.concat([_expand_degenerate_gen(seq, degen_thresh=degen_thresh) 
-                    for seq in seqs]).astype(str)
+    s2 = pd.concat([_expand_degenerate_gen(id_, seq, 
+                                           degen_thresh=degen_thresh) 
+                    for id_, seq in seqs.items()]).astype(str)
     s2.index.set_names('seq-name', inplace=True)
     s2.name = 'sequence'
     s3 = s2.reset_index()
@@ -136,16 +144,16 @@ def _collapse_all_sequences(condensed, reverse_complement_result):
     Collapse and reverse complelent the results and tidies it
     """
     # Collapses the data into grouped data and prints the computed result
-    grouped = condensed.groupby('amplicon')['seq-name'].apply(
-        lambda x: '>%s' % "|".join(np.sort(x.values)), meta=('seq-name', str))  
-    group2 = grouped.compute().reset_index()
+    condensed = condensed.compute()
+    amplicons, names = _join_sorted_runs(condensed['amplicon'].values,
+                                         condensed['seq-name'].values)
+    group2 = pd.DataFrame({'amplicon': amplicons, 
+                           'seq-name': ['>%s' % name for name in names]})
     group2.sort_values('seq-name', inplace=True)
     # Reverse complemnents the sequences if desired
     if reverse_complement_result:
-        def _rc(x):
-            seq = skbio.DNA(x['amplicon'])
-            return seq.reverse_complement()
-        group2['seq'] = group2.apply(_rc, axis=1).astype(str)
+        group2['seq'] = group2['amplicon'].str.translate(complement_table)
+        group2['seq'] = group2['seq'].str[::-1]
     else:
         group2['seq'] = group2['amplicon']
     
@@ -160,29 +168,109 @@ def _condense_seqs(seqs):
     """
     Collapses duplicate sequences before processing
     """
-    seqs.sort_values(['amplicon', 'seq-name'], inplace=True)
-    fragment = \
-        seqs.groupby(['amplicon'])['seq-name'].apply(lambda x: "|".join(x))
-    return fragment.sort_index().reset_index()
+    amplicons, names = _join_sorted_runs(seqs['amplicon'].values, 
+                                         seqs['seq-name'].values)
+    return pd.DataFrame({'amplicon': amplicons, 'seq-name': names})
 
 
-def _expand_degenerate_gen(seq_, degen_thresh=3):
+def _join_sorted_runs(keys, values, delim='|'):
+    """
+    Joins the values which share a key
+
+    The keys and values are factorized into sorted integer codes so the 
+    pairs can be ordered with a lexsort and identical keys form a single
+    contiguous run, which is collapsed into one delimited string. The 
+    strings themselves stay as python objects rather than being padded 
+    into a fixed width array.
+
+    Parameters
+    ----------
+    keys: ndarray
+        The key (i.e. amplicon sequence) for each value
+    values: ndarray
+        The values (i.e. sequence names) to be joined
+    delim: str, optional
+        The string used to join values in the same run
+
+    Returns
+    -------
+    ndarray
+        The sorted, unique keys
+    list
+        The sorted values for each key joined by the delimiter
+    """
+    key_codes, unique_keys = pd.factorize(np.asarray(keys, dtype=object), 
+                                          sort=True)
+    values = np.asarray(values, dtype=object)
+    value_codes, _ = pd.factorize(values, sort=True)
+    order = np.lexsort([value_codes, key_codes])
+    key_codes = key_codes[order]
+    values = values[order]
+
+    new_run = np.ones(len(key_codes), dtype=bool)
+    new_run[1:] = key_codes[1:] != key_codes[:-1]
+    starts = np.flatnonzero(new_run)
+    ends = np.hstack([starts[1:], [len(key_codes)]]).astype(int)
+    joined = [delim.join(values[start:end]) 
+              for start, end in zip(starts, ends)]
+
+    return np.asarray(unique_keys, dtype=object), joined
+
+
+def _expand_degenerate_gen(id_, seq_, degen_thresh=3):
     """
     Expands the degenerate sequences in the seq blocks
     """
-    id_ = seq_.metadata['id']
-    if seq_.has_degenerates():
-        expand = pd.Series([s for s in seq_.expand_degenerates()]).astype(str)
-        expand.sort_values(inplace=True)
-        expand.reset_index(inplace=True, drop=True)
-        expand.rename(index={i: '%s@%s' % (id_, str(i + 1).zfill(4)) 
-                             for i in expand.index},
-                      inplace=True)
+    expanded = _expand_degenerates(seq_)
+    if len(expanded) > 1:
+        expand = pd.Series(
+            np.sort(expanded).astype(object),
+            index=['%s@%s' % (id_, str(i + 1).zfill(4)) 
+                   for i in np.arange(len(expanded))],
+            )
     else:
         expand = pd.Series({id_: seq_}).astype(str)
     return expand
 
 
+def _expand_degenerates(seq_):
+    """
+    Resolves every degenerate nucleotide in a sequence
+
+    Every combination of the degenerate positions is enumerated as a 
+    mixed-radix counter written directly into a (combinations x length) 
+    byte array rather than building each sequence separately.
+
+    Parameters
+    ----------
+    seq_: str
+        The sequence to expand
+
+    Returns
+    -------
+    ndarray
+        The expanded sequences. A sequence without degenerate nucleotides
+        is returned unchanged.
+    """
+    codes = np.frombuffer(seq_.encode('ascii'), dtype=np.uint8)
+    positions = np.flatnonzero(is_degen[codes])
+    if len(positions) == 0:
+        return np.array([seq_])
+    options = [degen_codes[codes[i]] for i in positions]
+    radix = np.array([len(opt) for opt in options], dtype=int)
+    # The last position changes fastest, so the stride for each position
+    # is the number of combinations of the positions following it
+    strides = np.hstack([np.cumprod(radix[::-1])[::-1][1:], [1]]).astype(int)
+    num_combos = int(np.prod(radix))
+
+    expanded = np.repeat(codes[np.newaxis, :], num_combos, axis=0)
+    counter = np.arange(num_combos)
+    for pos, opts, stride, base in zip(*(positions, options, strides, radix)):
+        expanded[:, pos] = opts[(counter // stride) % base]
+
+    return expanded.view('S%i' % len(codes)).flatten().astype(str)
+
+
 def _expand_ids(group2, fwd_primer, rev_primer, region, trim_length, 
     chunk_size):
     """
@@ -1,4 +1,3 @@
-import copy
 import itertools as it
 import os
 import warnings
@@ -10,6 +9,7 @@ from dask.delayed import Delayed
 import dask.dataframe as dd
 import numpy as np
 import pandas as pd
+from scipy.sparse import csr_matrix
 
 from qiime2 import Metadata, Artifact
 from qiime2.plugin import ValidationError
@@ -111,19 +111,20 @@ def reconstruct_counts(
         for table_ in regional_table[1:]:
             counts = counts.merge(table_)
 
+    # We have to account for the fact that some of hte ASVs may have been 
+    # discarded because they didn't meet the match parameters we've set or 
+    # because they're not in the database. These are dropped while the 
+    # table is still sparse so only the aligned ASVs are ever densified.
+    keep_asvs = set(align_mat['asv'].values) & \
+        set(counts.ids(axis='observation'))
+    counts = counts.filter(lambda v, id_, md: id_ in keep_asvs,
+                           axis='observation', inplace=False)
     counts = pd.DataFrame(
         counts.matrix_data.toarray(),
         index=counts.ids(axis='observation'),
         columns=counts.ids(axis='sample'),
     )
     counts.fillna(0, inplace=True)
-
-    # We have to account for the fact that some of hte ASVs may have been 
-    # discarded because they didn't meet the match parameters we've set or 
-    # because they're not in the database.
-    keep_asvs = list(set(align_mat['asv'].values) & (set(counts.index)))
-    unaligned_counts = counts.copy().drop(keep_asvs).sum(axis=1)
-    counts = counts.loc[keep_asvs]
     keep_samples = counts.sum(axis=0) > min_counts
     if keep_samples.all() == False:
         raise ValueError('There are {samples:d} samples with fewer than '
@@ -277,6 +278,56 @@ def _construct_align_mat(matches, sequence_map, seq_summary,
     return asv_ref
 
 
+def _build_align_matrix(align_mat, asvs, seqs=None, seq_name='clean_name', 
+    asv_name='asv', value='norm'):
+    """
+    Builds a sparse ASV x reference sequence alignment matrix
+
+    Parameters
+    ----------
+    align_mat: DataFrame
+        A mapping of the match probability and error rate between matched
+        kmers for iterative processing and reconstruction.
+    asvs: array-like
+        The ASV identifiers, in the order they should appear in the rows.
+    seqs: array-like, optional
+        The reference sequence identifiers, in the order they should appear
+        in the columns. If no sequences are provided, all the reference
+        sequences aligned to `asvs` are used in sorted order.
+    seq_name: str, optional
+        The label for the original sequence in the database a kmer comes from
+    asv_name : str, optional
+        The column in `align_mat` which identifies the ASV identifer for each
+        sequence that was mapped to a kmer.
+    value: str, optional
+        The column in `align_mat` holding the matrix values. Duplicated 
+        ASV/reference pairs are averaged.
+
+    Returns
+    -------
+    csr_matrix
+        The alignment values for each ASV (row) and reference sequence 
+        (column)
+    ndarray
+        The reference sequence identifier for each column
+    """
+    align_mat = align_mat.loc[align_mat[asv_name].isin(asvs)]
+    if seqs is None:
+        seqs = np.unique(align_mat[seq_name].values)
+    else:
+        align_mat = align_mat.loc[align_mat[seq_name].isin(seqs)]
+    align = align_mat.groupby([asv_name, seq_name])[value].mean()
+
+    asv_idx = pd.Index(asvs).get_indexer(
+        align.index.get_level_values(asv_name))
+    seq_idx = pd.Index(seqs).get_indexer(
+        align.index.get_level_values(seq_name))
+    align = csr_matrix((align.values, (asv_idx, seq_idx)), 
+                       shape=(len(asvs), len(seqs)))
+
+    return align, np.asarray(seqs)
+
+
 def _expand_duplicate_sequences(df, id_col, delim='|'):
     """
     Expands delimited IDs into rows with unique identifiers
@@ -298,16 +349,10 @@ def _expand_duplicate_sequences(df, id_col, delim='|'):
         An expanded dataframe.
     """
     data_cols = df.drop(columns=[id_col]).columns
-    wide_exp = pd.concat(axis=1, objs=[
-        df[id_col].apply(lambda x: pd.Series(x.split(delim))),
-        df[data_cols]
-        ])
-    # Converts to long form and drops the duplicated anything without an ID
-    long_exp = wide_exp.melt(
-        id_vars=data_cols,
-        value_vars=wide_exp.drop(columns=data_cols).columns,
-        value_name=id_col
-    ).drop(columns=['variable']).dropna(subset=[id_col])
+    # Splits the ids into lists and explodes them into one row per id, 
+    # dropping anything without an ID
+    long_exp = df.assign(**{id_col: df[id_col].str.split(delim)})
+    long_exp = long_exp.explode(id_col).dropna(subset=[id_col])
     long_exp = long_exp[np.hstack([[id_col], data_cols.values])]
     long_exp.sort_values(by=list(long_exp.columns), inplace=True)
     long_exp.reset_index(inplace=True, drop=True)
@@ -365,16 +410,17 @@ def _scale_relative_abundance(align_mat, relative, counts, seq_summary,
         align_mat[seq_name].isin(relative.ids(axis='observation')) & 
         align_mat[asv_name].isin(counts.index)
         ]
-    align = align_mat.pivot_table(values='norm', index=asv_name, 
-                                  columns=seq_name, fill_value=0
-                                  )
-
     # And then we get indexing because I like to have the indexing
     # references
-    align = align[relative.ids(axis='observation')]
-    align_seqs = align.columns
-    align_asvs = align.index
-    align = align.values
+    align_asvs = pd.Index(np.unique(align_mat[asv_name].values))
+    align, align_seqs = _build_align_matrix(
+        align_mat, 
+        asvs=align_asvs, 
+        seqs=relative.ids(axis='observation'),
+        seq_name=seq_name, 
+        asv_name=asv_name,
+        )
+    align_seqs = pd.Index(align_seqs)
 
     counts = counts.loc[align_asvs]
     samples = list(relative.ids(axis='sample'))
@@ -398,16 +444,19 @@ def _scale_relative_abundance(align_mat, relative, counts, seq_summary,
             np.atleast_2d(count_j_given_r.sum(axis=0)).T,
             sample_ids=[sample], observation_ids=align_seqs,
             )
+    # Pulls the relative abundances out once in column order, so each 
+    # sample is a contiguous slice rather than a filtered copy of the whole
+    # table
+    relative_mat = relative.matrix_data.tocsc()
     scaled_counts = []
-    for sample in samples:
+    for i, sample in enumerate(samples):
         non_zero_asvs = (counts[sample] > 0).values
-        non_zero_seqs = (relative.data(sample) > 0)
-        relative_seqs = relative.copy().filter(align_seqs[non_zero_seqs], 
-                                               axis='observation')
+        freq = relative_mat[:, i].toarray().ravel()
+        non_zero_seqs = (freq > 0)
 
         counted = _solve_sample(
-            align[non_zero_asvs][:, non_zero_seqs],
-            relative_seqs.data(sample),
+            align[non_zero_asvs][:, non_zero_seqs].toarray(),
+            freq[non_zero_seqs],
             counts.loc[non_zero_asvs, [sample]],
             align_seqs[non_zero_seqs],
             sample
@@ -498,22 +547,18 @@ def _solve_iterative_noisy(align_mat, table, seq_summary, tolerance=1e-7,
     # Gets the sparse alignment matrix
     # Gets the alignment matrix because its cheaper outside the loop
     # We get a sparse matrix because hopefully it works better.
-    align_mat = align_mat.loc[align_mat['asv'].isin(table.index)]
-    align = align_mat.pivot_table(values='norm', index=asv_name, 
-                                  columns=seq_name, fill_value=0
-                                  )
-    align = align.loc[table.index]
-    # And then we get indexing because I like to have the indexing
-    # references
-    align_seqs = align.columns.values
-    align_asvs = align.index.values
+    align, align_seqs = _build_align_matrix(align_mat, 
+                                            asvs=table.index,
+                                            seq_name=seq_name,
+                                            asv_name=asv_name)
 
     recon = []
     for sample, col_ in table.items():
-        filt_align = align.loc[col_ > 0].values
+        filt_align = align[(col_ > 0).values]
         abund = col_[col_ > 0].values
-        sub_seqs = copy.copy(align_seqs)[(filt_align > 0).any(axis=0)]
-        filt_align = filt_align[:, (filt_align > 0).sum(axis=0) > 0]
+        mapped = np.asarray((filt_align > 0).sum(axis=0)).flatten() > 0
+        sub_seqs = align_seqs[mapped]
+        filt_align = filt_align[:, mapped].toarray()
 
         freq_ = dask.delayed(_solve_ml_em_iterative_1_sample)(
             align=filt_align,
@@ -68,10 +68,9 @@ def reconstruct_taxonomy(reconstruction_map: pd.Series,
     # Filters the taxonomy and converts to levels
     db_lookup = database_params.get(database, 'none')
     delim = db_lookup['delim']
-    def split_taxonomy(x):
-        return pd.Series([s.strip(' ') for s in  x.split(delim)])
     taxonomy = taxonomy.loc[reconstruction_map.index]
-    taxonomy = taxonomy.apply(split_taxonomy)
+    taxonomy = taxonomy.str.split(delim, expand=True)
+    taxonomy = taxonomy.apply(lambda x: x.str.strip(' '))
     taxonomy.index.set_names('Feature ID', inplace=True)
 
     if len(taxonomy.columns) == 1:
@@ -80,12 +79,10 @@ def reconstruct_taxonomy(reconstruction_map: pd.Series,
 
     # Finds the undefined levels
     defined_f = db_lookup['defined']
-    undefined_levels = ~pd.concat(axis=1, objs=[
-        taxonomy[c].apply(defined_f) for c in taxonomy.columns
-    ])
-    ambigious_levels = pd.concat(axis=1, objs=[
-        taxonomy[c].apply(lambda x: 'ambig' in x) for c in taxonomy.columns
-        ])
+    undefined_levels = ~taxonomy.apply(defined_f).astype(bool)
+    ambigious_levels = taxonomy.apply(
+        lambda x: x.str.contains('ambig', regex=False, na=False)
+        )
     ambigious_levels = ambigious_levels.cummax(axis=1)
     undefined = (undefined_levels | 
                  (ambigious_levels & (ambiguity_handling == 'missing'))
@@ -99,29 +96,25 @@ def reconstruct_taxonomy(reconstruction_map: pd.Series,
     if define_missing == 'inherit':
         taxonomy.fillna(method='ffill', axis=1, inplace=True)
 
-    # Combines the taxonomy across multiple  levels
-    def _combine_f(x):
-        if pd.isnull(x).all():
-            return np.nan
-        else:
-            return '|'.join(np.sort(x.dropna().unique()))
-
-    def _combine_taxa(g):
-        """Help function ot tidy taxonomy"""
-        if len(g) == 1:
-            return g.iloc[0]
-        else:
-            return g.apply(_combine_f)
-
+    # Combines the taxonomy across multiple levels by joining the sorted,
+    # unique annotations at each level within a reconstructed sequence
+    levels = taxonomy.columns
     taxonomy['clean_name'] = reconstruction_map
-    collapsed  = taxonomy.groupby('clean_name').apply(_combine_taxa)
-    collapsed.drop(columns=['clean_name'], inplace=True)
+    long_ = taxonomy.melt(id_vars='clean_name', var_name='level', 
+                          value_name='taxon').dropna()
+    long_.drop_duplicates(inplace=True)
+    long_.sort_values(['clean_name', 'level', 'taxon'], inplace=True)
+    collapsed = long_.groupby(['clean_name', 'level'])['taxon'].agg('|'.join)
+    collapsed = collapsed.unstack('level').reindex(
+        index=pd.Index(np.unique(reconstruction_map.values), 
+                       name='clean_name'),
+        columns=levels,
+        ).astype(object)
 
     # Finds splits in the data
-    disjoint = pd.concat(axis=1, objs=[
-        collapsed[c].apply(lambda x: True if pd.isnull(x) else '|' in x) 
-        for c in collapsed.columns
-        ]).cummax(axis=1)
+    disjoint = (collapsed.isna() | collapsed.apply(
+        lambda x: x.str.contains('|', regex=False, na=True).astype(bool)
+        )).cummax(axis=1)
     # Set up inherietence so you inheriet the first split in each row 
     # of the data
     disjoint_inheriet = (disjoint.cummax(axis=1) & 
@@ -131,7 +124,9 @@ def reconstruct_taxonomy(reconstruction_map: pd.Series,
     # Does nan inherietence
     collapsed.fillna(method='ffill', axis=1,  inplace=True)
     # Returns  the summarized taxonomy
-    new_taxa = collapsed.apply(lambda x: delim.join(list(x.values)), axis=1)
+    new_taxa = collapsed[levels[0]].str.cat(
+        [collapsed[c] for c in levels[1:]], sep=delim
+        )
 
     new_taxa.name = 'Taxon'
     new_taxa.index.set_names('Feature ID', inplace=True)
@@ -49,21 +49,19 @@ def _4(obj: pd.DataFrame) -> KmerMapFormat:
 
 @plugin.register_transformer
 def _5(ff:KmerAlignFormat) -> pd.DataFrame:
-    df = pd.read_csv(str(ff), sep='\t', dtype=str)
-    df = df[['kmer', 'asv', 'length', 'mismatch', 'max-mismatch', 'region']]
-    df[['mismatch', 'max-mismatch', 'length']] = \
-        df[['mismatch', 'max-mismatch', 'length']].astype(int)
-    return df
+    cols = ['kmer', 'asv', 'length', 'mismatch', 'max-mismatch', 'region']
+    df = pd.read_csv(str(ff), sep='\t', usecols=cols, 
+                     dtype={'kmer': str, 'asv': str, 'region': str, 
+                            'length': int, 'mismatch': int, 
+                            'max-mismatch': int})
+    return df[cols]
 
 
 @plugin.register_transformer
 def _6(ff:KmerAlignFormat) -> Metadata:
-    df = pd.read_csv(str(ff), sep='\t', dtype=str)
-    df =  df[['kmer', 'asv', 'length', 'mismatch', 'max-mismatch', 'region']]
+    df = _5(ff)
     df.index = df.index.astype(int).astype(str)
     df.index.set_names('feature-id', inplace=True)
-    df[['mismatch', 'max-mismatch', 'length']] = \
-        df[['mismatch', 'max-mismatch', 'length']].astype(int)
     return Metadata(df)
 
 @plugin.register_transformer
@@ -1,13 +1,15 @@
+import functools
 import re
 
 import dask
 import numpy as np
 import pandas as pd
-from skbio import DNA, TabularMSA
+from skbio import DNA
 from skbio.alignment import local_pairwise_align_ssw
 
 from qiime2 import Metadata
 from q2_feature_classifier._cutter import (_local_aln)
+from q2_sidle._align import _encode_seqs
 from q2_sidle._utils import (degen_sub,
                              _check_regions,
                             )
@@ -100,24 +102,12 @@ def reconstruct_fragment_rep_seqs(
 
     # Determines the positions for each of the primer regions. We first look
     # for an exact match using regex
-    fwd_rep = {primer: _expand_primer(primer, None) 
-               for primer in concensus_map['first-fwd-primer'].unique()}
-    rev_rep = {primer: _expand_primer(primer, None) 
-               for primer in concensus_map['last-fwd-primer'].unique()}
-    concensus_map['f_exact'] = \
-        concensus_map['first-fwd-primer'].replace(fwd_rep)
-    concensus_map['r_exact'] = \
-        concensus_map['last-fwd-primer'].replace(rev_rep)
-
-    # Finds sequences with exact matches
     concensus_map['start'] = \
-        concensus_map[['sequence', 'f_exact']].astype(str).apply(
-        _find_exact_forward, axis=1
-    )
+        _scan_exact_forward(concensus_map['sequence'], 
+                            concensus_map['first-fwd-primer'])
     concensus_map['end'] = \
-        concensus_map[['sequence', 'r_exact']].astype(str).apply(
-        _find_exact_forward, axis=1
-    )
+        _scan_exact_forward(concensus_map['sequence'], 
+                            concensus_map['last-fwd-primer'])
 
     # Finds fuzzy matches. We assume that since we know sequences from this
     # concensus were amplified using this primer that we let the fuzzy
@@ -160,6 +150,28 @@ def _expand_primer(primer, error=None):
     return new_
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_primer(primer):
+    """
+    Expands and compiles a primer pattern, caching it for later calls
+
+    `re` already keeps its own cache of compiled patterns, so the saving 
+    here is the degenerate expansion in `_expand_primer`, which is done 
+    once per primer rather than on every call.
+
+    Parameters
+    ----------
+    primer: str
+        The primer sequence, which may contain degenerate nucleotides
+
+    Returns
+    -------
+    re.Pattern
+        The compiled pattern for the expanded primer
+    """
+    return re.compile(_expand_primer(primer, None))
+
+
 def _find_exact_forward(args):
     """
     Finds the exact match for a forward primer
@@ -184,6 +196,37 @@ def _find_exact_reverse(args):
         return match.span()[0]
 
 
+def _scan_exact_forward(sequences, primers):
+    """
+    Finds the end of the first exact primer match for a set of sequences
+
+    Parameters
+    ----------
+    sequences: Series
+        The sequences to be searched
+    primers: Series
+        The primer sequence for each sequence, indexed like `sequences`
+
+    Returns
+    -------
+    Series
+        The position immediately after the primer match, or nan when the
+        primer is not found
+    """
+    # Each primer pattern is compiled once (and cached between calls) and
+    # scanned over all of the sequences it applies to, rather than searched 
+    # row by row
+    positions = {}
+    sequences = sequences.astype(str)
+    for primer, seqs in sequences.groupby(primers.astype(str), sort=False):
+        search = _compile_primer(primer).search
+        for id_, seq_ in seqs.items():
+            match = search(seq_)
+            positions[id_] = np.nan if match is None else match.span()[1]
+
+    return pd.Series(positions, dtype=float).reindex(sequences.index)
+
+
 def _find_approx_forward(args):
     """
     Finds an approximate match for a forward primer
@@ -207,6 +250,32 @@ def _find_approx_reverse(args):
 def _group_concensus(seqs):
     """
     Collapses grouped sequences to a concensus sequence
+
+    Parameters
+    ----------
+    seqs: Series
+        The aligned sequences in the group
+
+    Returns
+    -------
+    DNA
+        The degapped majority concensus for the group. Ties are broken
+        in favor of the character with the lowest ASCII code, and a gap
+        only wins a position outright, as in `skbio.TabularMSA.consensus`.
     """
-    concensus = TabularMSA(seqs).consensus().degap()
-    return concensus
+    _, codes = _encode_seqs(seqs)
+    num_pos = codes.shape[1]
+
+    # Merges both gap characters and sorts them after the nucleotides so 
+    # that ties at a position never resolve to a gap
+    codes = np.where((codes == ord('-')) | (codes == ord('.')), 255, codes)
+
+    # Counts each character at each position in a single bincount by 
+    # offsetting the codes by column, then takes the most common
+    counts = np.bincount((codes.astype(int) * num_pos + 
+                          np.arange(num_pos)).ravel(),
+                         minlength=256 * num_pos).reshape(256, num_pos)
+    concensus = counts.argmax(axis=0).astype(np.uint8)
+    concensus[concensus == 255] = ord('-')
+
+    return DNA(concensus.tobytes().decode('ascii')).degap()
@@ -36,7 +36,8 @@ def trim_dada2_posthoc(table: biom.Table,
     """
 
     # Trims the sequences
-    seq_length = representative_sequences.apply(lambda x: len(x))
+    rep_seqs = representative_sequences.astype(str)
+    seq_length = rep_seqs.str.len()
 
     if trim_length == 0:
         trim_length = seq_length.min()
@@ -44,38 +45,31 @@ def trim_dada2_posthoc(table: biom.Table,
     if (seq_length < trim_length).any():
         warnings.warn("There are ASVs shorter than the trim length. "
                           "These sequences will be discarded.", UserWarning)
-    rep_seqs = representative_sequences.astype(str)
-    rep_seqs = rep_seqs.loc[seq_length >= trim_length].copy()
-    rep_seqs = pd.DataFrame(data=[rep_seqs.apply(lambda x: x[:trim_length])],
-                            index=['sequence']
-                            ).T
+    rep_seqs = rep_seqs.loc[seq_length >= trim_length]
+    rep_seqs = rep_seqs.str.slice(0, trim_length)
+    rep_seqs.name = 'sequence'
 
     # Collapses the table based on the trimmed sequences
     table.filter(lambda v, id_, md: id_ in rep_seqs.index,
                  axis='observation',
                  inplace=True
                  )
-    table.add_metadata(
-        rep_seqs.loc[table.ids(axis='observation')].to_dict(orient='index'),
-        axis='observation')
-
-    table2 = table.collapse(lambda id_, md: md['sequence'], 
+    seq_map = rep_seqs.to_dict()
+    table2 = table.collapse(lambda id_, md: seq_map[id_], 
                             norm=False,
                             axis='observation')
 
-    seqs2 = rep_seqs.drop_duplicates()['sequence'].copy()
+    seqs2 = rep_seqs.drop_duplicates().copy()
 
+    # Each unique trimmed sequence is hashed once and the same identifier
+    # is used for the table and the sequences
     if hashed_feature_ids:
-        table2.update_ids(
-            {seq_: _hash_seq(seq_) for seq_ in table2.ids(axis='observation')},
-            axis='observation',
-            inplace=True
-            )
-        seqs2.rename({id_: _hash_seq(seq_) for id_, seq_ in seqs2.items()}, 
-                    inplace=True)
+        new_ids = {seq_: _hash_seq(seq_) for seq_ in seqs2.values}
+        table2.update_ids(new_ids, axis='observation', inplace=True)
     else:
-        seqs2.rename({id_: seq_ for id_, seq_ in seqs2.items()}, 
-                    inplace=True)
+        new_ids = {seq_: seq_ for seq_ in seqs2.values}
+    seqs2.index = pd.Index(seqs2.map(new_ids).values, 
+                           name=seqs2.index.name)
 
     return table2, seqs2
 
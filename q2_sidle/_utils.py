@@ -128,6 +128,46 @@ def _convert_generator_to_seq_block(generator, chunksize=5000):
     return seq_block
 
 
+def _read_fasta_blocks(filepath, chunksize=5000):
+    """
+    Streams a fasta file as blocks of sequences
+
+    Parameters
+    ----------
+    filepath: str
+        The path to the fasta file
+    chunksize: int, optional
+        The maximum number of sequences in each block
+
+    Returns
+    -------
+    generator
+        A generator of Series where the index is the sequence identifier
+        and the value is the sequence as a string. Only a single block is
+        held in memory at a time and no sequence objects are constructed.
+    """
+    ids = []
+    seqs = []
+    seq_ = None
+    with open(str(filepath)) as f_:
+        for line in f_:
+            line = line.strip()
+            if line.startswith('>'):
+                if seq_ is not None:
+                    seqs.append(''.join(seq_))
+                if len(seqs) == chunksize:
+                    yield pd.Series(seqs, index=ids, dtype=str)
+                    ids, seqs = [], []
+                ids.append(line[1:].split()[0])
+                seq_ = []
+            elif line:
+                seq_.append(line)
+    if seq_ is not None:
+        seqs.append(''.join(seq_))
+    if len(seqs) > 0:
+        yield pd.Series(seqs, index=ids, dtype=str)
+
+
 def _to_seq_array(x):
     """
     Converts a list of sequences from a generator to a DataFrame of sequences
@@ -174,28 +214,30 @@ database_params = {
     'greengenes': {
         'delim': '; ',
         # 'levels': ['k__', 'p__', 'c__', 'o__', 'f__', 'g__', 's__'],
-        'defined': lambda x: len(x) > 3,
+        'defined': lambda x: x.str.len() > 3,
         'inherient': lambda x: 'unsp. %s' % x.replace('__', '. '),
         'contested': lambda x: x.replace('[', 'cont. ').replace(']', '')
     },
     'silva': {
         'delim': ';',
         # 'levels': [],
-        'defined': lambda x: ~(('uncul' in  x) | ('metagenome' in x)),
+        'defined': lambda x: ~(
+            x.str.contains('uncul', regex=False, na=False) | 
+            x.str.contains('metagenome', regex=False, na=False)),
         'inherient': lambda x: x,
         'contested': lambda x: x.replace('[', 'cont. ').replace(']', ''),
     },
     'homd': {
         'delim': ';',
         # 'levels': [],
-        'defined': lambda x: True,
+        'defined': lambda x: pd.Series(True, index=x.index),
         'inherient': lambda x: x,
         'contested': lambda x: x.replace('[', 'cont. ').replace(']', ''),
     },
     'none': {
         'delim': ';',
         # 'levels': [],
-        'defined': lambda x: True,
+        'defined': lambda x: pd.Series(True, index=x.index),
         'inherient': lambda x: x,
         'contested': lambda x: x,
     },
@@ -1,6 +1,7 @@
 from unittest import TestCase, main
 
 import numpy as np
+import numpy.testing as npt
 import pandas as pd
 import pandas.testing as pdt
 from skbio import DNA
@@ -10,7 +11,11 @@ from q2_types.feature_data import DNAIterator, DNAFASTAFormat
 
 from q2_sidle._align import (align_regional_kmers,
                              _align_kmers,
+                             _align_block,
                              _check_read_lengths,                        
+                             _default_block_size,
+                             _encode_seqs,
+                             _split_encoded,
                              )
 
 
@@ -37,7 +42,8 @@ class AlignTest(TestCase):
     def test_align_kmers_length_error(self):
         with self.assertRaises(ValueError):
             align_regional_kmers(
-              Artifact.import_data('FeatureData[Sequence]', self.seq_array), 
+              Artifact.import_data('FeatureData[Sequence]', 
+                                   self.seq_array).view(DNAFASTAFormat), 
               self.in_mer, 
               region='Gotham',  
               debug=True)
@@ -98,7 +104,7 @@ class AlignTest(TestCase):
         known['mismatch'] = known['mismatch'].astype(int)
         known['max-mismatch'] = known['max-mismatch'].astype(int)
         
-        match = align_regional_kmers(kmers.view(pd.Series),
+        match = align_regional_kmers(kmers.view(DNAFASTAFormat),
                                               rep_set.view(pd.Series),
                                               region='Bludhaven',
                                               debug=True,
@@ -111,6 +117,47 @@ class AlignTest(TestCase):
             )
 
 
+    def test_align_kmers_tiled(self):
+        known = _align_kmers(self.seq_array.astype(str), self.reads2, 
+                             allowed_mismatch=3)
+        test = _align_kmers(self.seq_array.astype(str), self.reads2, 
+                            allowed_mismatch=3, block_size=2)
+        pdt.assert_frame_equal(known, test)
+
+    def test_default_block_size(self):
+        short_ = _default_block_size(10)
+        long_ = _default_block_size(1000)
+        self.assertTrue(short_ >= long_)
+        self.assertTrue(long_ >= 16)
+
+    def test_align_block(self):
+        codes1 = np.array([[65, 71, 84, 67], 
+                           [65, 82, 87, 83]], dtype=np.uint8)
+        codes2 = np.array([[65, 71, 84, 67],
+                           [87, 71, 87, 78],
+                           [65, 71, 84, 84]], dtype=np.uint8)
+        test1, test2, test_mismatch = \
+            _align_block(codes1, codes2, 1, offset1=5, offset2=10)
+        npt.assert_array_equal(test1, np.array([5, 5]))
+        npt.assert_array_equal(test2, np.array([10, 12]))
+        npt.assert_array_equal(test_mismatch, np.array([0, 1]))
+
+    def test_encode_seqs(self):
+        known_codes = np.array([[65, 71, 84, 67],
+                                [87, 71, 87, 78],
+                                [65, 71, 84, 84]], dtype=np.uint8)
+        test_ids, test_codes = _encode_seqs(self.reads2)
+        npt.assert_array_equal(test_ids, np.array(['r2.0', 'r2.1', 'r2.2']))
+        npt.assert_array_equal(test_codes, known_codes)
+
+    def test_split_encoded(self):
+        ids, codes = _encode_seqs(self.reads2)
+        blocks = _split_encoded(ids, codes, 2)
+        self.assertEqual(len(blocks), 2)
+        npt.assert_array_equal(blocks[0][0], np.array(['r2.0', 'r2.1']))
+        npt.assert_array_equal(blocks[1][0], np.array(['r2.2']))
+        npt.assert_array_equal(blocks[1][1], codes[2:])
+
     def test_check_read_length_pass(self):
         number_, length_ = _check_read_lengths(self.in_mer, 'inmer')
         self.assertEqual(length_, 9)
@@ -3,6 +3,7 @@ import warnings
 
 import dask.dataframe as dd
 import numpy as np
+import numpy.testing as npt
 import pandas as pd
 import pandas.testing as pdt
 import skbio
@@ -16,7 +17,9 @@ from q2_sidle._extract import (prepare_extracted_region,
                                _collapse_all_sequences,
                                _condense_seqs,
                                _expand_degenerate_gen,
+                               _expand_degenerates,
                                _expand_ids,
+                               _join_sorted_runs,
                                _split_ids,
                                )
 from q2_sidle.tests import test_set as ts
@@ -145,7 +148,7 @@ class ExtractTest(TestCase):
         pdt.assert_frame_equal(test, self.amplicon_r)
 
     def test_block_seqs(self):
-        test = _block_seqs(self.trimmed.view(pd.Series).values)
+        test = _block_seqs(self.trimmed.view(pd.Series).astype(str))
         pdt.assert_frame_equal(self.seq_block, test)
 
     def test_collapse_all_sequences_fwd(self):
@@ -186,18 +189,44 @@ class ExtractTest(TestCase):
             )
 
     def test_expand_degenerate_gen_no_degen(self):
-        seq = skbio.DNA('GCGAAGCGGCTCAGG', metadata={'id': 'seq1'})
         known = pd.Series({'seq1': 'GCGAAGCGGCTCAGG'})
-        test = _expand_degenerate_gen(seq)
+        test = _expand_degenerate_gen('seq1', 'GCGAAGCGGCTCAGG')
         pdt.assert_series_equal(test, known)
 
     def test_expand_degenerate_gen_degen(self):
-        seq = skbio.DNA('WTCCGCGTTGGAGTT', metadata={'id': 'seq3'})
         known = pd.Series({'seq3@0001': 'ATCCGCGTTGGAGTT',
                            'seq3@0002': 'TTCCGCGTTGGAGTT'})
-        test = _expand_degenerate_gen(seq)
+        test = _expand_degenerate_gen('seq3', 'WTCCGCGTTGGAGTT')
         pdt.assert_series_equal(test, known)
 
+    def test_join_sorted_runs(self):
+        keys = np.array(['TCAGG', 'GAGTT', 'TCAGG', 'TCAGG'])
+        values = np.array(['seq2', 'seq3', 'seq1', 'seq4|seq5'])
+        test_keys, test_joined = _join_sorted_runs(keys, values)
+        npt.assert_array_equal(test_keys, np.array(['GAGTT', 'TCAGG']))
+        self.assertEqual(test_joined, ['seq3', 'seq1|seq2|seq4|seq5'])
+
+    def test_join_sorted_runs_long_run(self):
+        long_ = '|'.join(['seq%i' % i for i in np.arange(1000, 2000)])
+        keys = np.array(['TCAGG', 'GAGTT', 'TCAGG', 'CCCCC'], dtype=object)
+        values = np.array(['seq2', 'seq3', long_, 'seq1'], dtype=object)
+        test_keys, test_joined = _join_sorted_runs(keys, values)
+        self.assertEqual(test_keys.dtype, object)
+        npt.assert_array_equal(test_keys, 
+                               np.array(['CCCCC', 'GAGTT', 'TCAGG']))
+        self.assertEqual(test_joined, 
+                         ['seq1', 'seq3', '%s|seq2' % long_])
+
+    def test_expand_degenerates(self):
+        known = np.array(['AAGCA', 'AAGTA', 'ACGCA', 'ACGTA', 
+                          'TAGCA', 'TAGTA', 'TCGCA', 'TCGTA'])
+        test = _expand_degenerates('WMGYA')
+        npt.assert_array_equal(known, np.sort(test))
+
+    def test_expand_degenerates_no_degen(self):
+        test = _expand_degenerates('GCGAAGCGG')
+        npt.assert_array_equal(np.array(['GCGAAGCGG']), test)
+
     def test_expand_ids(self):
         test = _expand_ids(self.group_forward, self.fwd_primer, 'ATGATGATG',
                            'Bludhaven', 15, 1000).compute()
@@ -17,6 +17,7 @@ from qiime2 import Artifact, Metadata
 from qiime2.plugin import ValidationError
 
 from q2_sidle._reconstruct import (reconstruct_counts,
+                                   _build_align_matrix,
                                    _construct_align_mat,
                                    _expand_duplicate_sequences,
                                    _get_db_and_clean,
@@ -344,6 +345,27 @@ class ReconstructTest(TestCase):
 
         pdt.assert_frame_equal(self.align2, test_mat)
 
+    def test_build_align_matrix(self):
+        align_mat = pd.DataFrame(
+            data=[['asv01', 'seq1', 0.5],
+                  ['asv01', 'seq2', 0.25],
+                  ['asv02', 'seq2', 0.75],
+                  ['asv02', 'seq2', 0.25],
+                  ['asv03', 'seq3', 1.0]],
+            columns=['asv', 'clean_name', 'norm'],
+            )
+        known = np.array([[0, 0.5], [0.5, 0.25]])
+        test, test_seqs = _build_align_matrix(align_mat, 
+                                              asvs=['asv02', 'asv01'])
+        npt.assert_array_equal(test.toarray(), known)
+        npt.assert_array_equal(test_seqs, np.array(['seq1', 'seq2']))
+
+        test, test_seqs = _build_align_matrix(align_mat, 
+                                              asvs=['asv01', 'asv03'],
+                                              seqs=['seq3', 'seq1'])
+        npt.assert_array_equal(test.toarray(), np.array([[0, 0.5], [1, 0]]))
+        npt.assert_array_equal(test_seqs, np.array(['seq3', 'seq1']))
+
     def test_expand_duplicate_sequences(self):
         original = pd.DataFrame(data=[['1', '2|3', '3|4|5', '6'],
                                       [10, 20, 30, 40]],
@@ -18,7 +18,9 @@ from q2_sidle._tree import (reconstruct_fragment_rep_seqs,
                             _find_exact_reverse,
                             _find_approx_forward,
                             _find_approx_reverse,
+                            _compile_primer,
                             _group_concensus,
+                            _scan_exact_forward,
                             )
 from q2_sidle.tests import test_set as ts
 
@@ -115,6 +117,27 @@ class TreeTest(TestCase):
         test = _find_exact_reverse(args)
         self.assertTrue(test, np.nan)    
 
+    def test_compile_primer(self):
+        _compile_primer.cache_clear()
+        test = _compile_primer('WANTCAT')
+        self.assertEqual(test.pattern, '[AT]A[ACGT]TCAT')
+        _compile_primer('WANTCAT')
+        self.assertEqual(_compile_primer.cache_info().hits, 1)
+
+    def test_scan_exact_forward(self):
+        sequences = pd.Series({
+            'seq01': '-CTAGTCATGCGAAGCGGCTCAGGATGATGATGAAGAC-----',
+            'seq02': 'ACTAGTCATGCGAAGCGGCTCAGGATGATGATGAAGAC-----',
+            'seq03': 'ACTAGTCATGCGAAGCGGCTCAGGATGATGATGAAGAC-----',
+            })
+        primers = pd.Series({'seq01': 'WANTCAT',
+                             'seq02': 'GGGGGGG',
+                             'seq03': 'ATGATGATG'})
+        known = pd.Series({'seq01': 9, 'seq02': np.nan, 'seq03': 33},
+                          dtype=float)
+        test = _scan_exact_forward(sequences, primers)
+        pdt.assert_series_equal(known, test)
+
     def test_find_approx_forward(self):
         args = pd.Series([
             DNA('-CTAGTCATGCGAAGCGGCTCAGGATGATGATGAAGAC--------------'),
@@ -137,6 +160,23 @@ class TreeTest(TestCase):
         test = _group_concensus(g)
         self.assertEqual(known, str(test))
 
+    def test_group_concensus_gap_ties(self):
+        # The second position is a three-way tie between C, G and a gap, 
+        # which goes to C. The third is only a gap once the "-" and "." 
+        # gaps are combined. The last is all gaps and is dropped.
+        g = pd.Series({'seq1': DNA('AC-T.-'),
+                       'seq2': DNA('A-GTA-'),
+                       'seq3': DNA('AG.TA.'),
+                       })
+        test = _group_concensus(g)
+        self.assertEqual('ACTA', str(test))
+
+    def test_group_concensus_dot_gap_tie(self):
+        # Ties between a "." gap and a nucleotide go to the nucleotide
+        g = pd.Series({'seq1': DNA('A.'), 'seq2': DNA('.A')})
+        test = _group_concensus(g)
+        self.assertEqual('AA', str(test))
+
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
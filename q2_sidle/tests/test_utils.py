@@ -14,6 +14,7 @@ from qiime2.plugin import ValidationError
 
 from q2_sidle._utils import (_count_degenerates,
                              _check_regions,
+                             _read_fasta_blocks,
                              )
 import q2_sidle.tests.test_set as ts
 from q2_types.feature_data import DNAIterator, DNAFASTAFormat
@@ -48,6 +49,14 @@ class UtilTest(TestCase):
         test = _count_degenerates(seq_array)
         pdt.assert_series_equal(known, test)
 
+    def test_read_fasta_blocks(self):
+        ff = self.seq_artifact.view(DNAFASTAFormat)
+        test = list(_read_fasta_blocks(str(ff), chunksize=2))
+        self.assertEqual(len(test), 2)
+        pdt.assert_series_equal(test[0], 
+                                pd.Series({'0': 'CATS', '1': 'WANT'}))
+        pdt.assert_series_equal(test[1], pd.Series({'2': 'CANS'}))
+
     def test_check_regions(self):
         regions = ['Bludhaven', 'Gotham']
         k_order = {'Bludhaven': 0, 'Gotham': 1}